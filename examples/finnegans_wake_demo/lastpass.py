@@ -1,39 +1,54 @@
 import datetime
+import multiprocessing
 import os
-import shutil
 import sys
 import json
-import struct
-import math
-from time import sleep
+import time
 import re
-import maya
-from twisted.logger import globalLogPublisher
+import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
 
-from nucypher.characters.lawful import Alice, Bob, Ursula
-from nucypher.data_sources import DataSource as Enrico
-from nucypher.network.middleware import RestMiddleware
-from nucypher.utilities.logging import simpleObserver
-from umbral.keys import UmbralPublicKey
+# maya, twisted, nucypher and umbral are imported where they are used, so paths
+# that only touch the feeds file or stdin don't pay for loading them.
+
+def json_default(obj):
+    # Bytes become hex; anything else without a native JSON form is a bug in the caller, not something to str()
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.hex()
+    raise TypeError("Object of type {} is not JSON serializable".format(type(obj).__name__))
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dump(obj, binary_file):
+        binary_file.write(orjson.dumps(obj, default=json_default, option=orjson.OPT_APPEND_NEWLINE))
+except ImportError:
+    # orjson is optional; fall back to the standard library (always returning bytes)
+    json_loads = json.loads
+
+    def json_dump(obj, binary_file):
+        # Stream the encoder's fragments instead of building the whole document as a str
+        text_file = io.TextIOWrapper(binary_file, encoding='utf-8', write_through=True)
+        json.dump(obj, text_file, default=json_default)
+        text_file.write('\n')
+        text_file.detach()  # Leave binary_file open for the caller
 
 # Boring setup stuff #
 
 # Execute the download script (download_finnegans_wake.sh) to retrieve the book
 BOOK_PATH = os.path.join('.', 'lastpass.json')
 
-# Twisted Logger
-globalLogPublisher.addObserver(simpleObserver)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JSON_FILE = os.path.join(BASE_DIR, "lastpass.json")
 
 # Temporary file storage
-TEMP_FILES_DIR = "{}/examples-runtime-cruft".format(os.path.dirname(os.path.abspath(__file__)))
-TEMP_DEMO_DIR = "{}/finnegans-wake-demo".format(TEMP_FILES_DIR)
-TEMP_CERTIFICATE_DIR = "{}/certs".format(TEMP_DEMO_DIR)
-
-# Remove previous demo files and create new ones
-shutil.rmtree(TEMP_FILES_DIR, ignore_errors=True)
-os.mkdir(TEMP_FILES_DIR)
-os.mkdir(TEMP_DEMO_DIR)
-os.mkdir(TEMP_CERTIFICATE_DIR)
+TEMP_FILES_DIR = os.path.join(BASE_DIR, "examples-runtime-cruft")
+TEMP_DEMO_DIR = os.path.join(TEMP_FILES_DIR, "finnegans-wake-demo")
+TEMP_CERTIFICATE_DIR = os.path.join(TEMP_DEMO_DIR, "certs")
 
 #######################################
 # Finnegan's Wake on NuCypher Testnet #
@@ -42,111 +57,221 @@ os.mkdir(TEMP_CERTIFICATE_DIR)
 
 TESTNET_LOAD_BALANCER = "eu-federated-balancer-40be4480ec380cd7.elb.eu-central-1.amazonaws.com"
 
-ursula = Ursula.from_seed_and_stake_info(host=TESTNET_LOAD_BALANCER,
-                                         certificates_directory=TEMP_CERTIFICATE_DIR,
-                                         federated_only=True,
-                                         minimum_stake=0)
-policy_end_datetime = maya.now() + datetime.timedelta(days=1)
+# In seconds; expirations are built straight from the epoch rather than maya.now() + timedelta
+POLICY_DURATION = datetime.timedelta(days=1).total_seconds()
+POLICY_RENEWAL_MARGIN = datetime.timedelta(hours=1).total_seconds()
+policy_end_datetime = None
 m, n = 1, 2
+RETRIEVAL_WORKERS = 16
+BOOK_BUFFER_SIZE = 1 << 20
+ENCRYPTION_CHUNKSIZE = 32
+PASSAGES_IN_FLIGHT = 512  # Passages read but not yet written out; bounds memory for any book size
 label = b"secret/files/and/stuff"
 
+WHITESPACE_PATTERN = re.compile(rb'\s+')
+
 
 def json_updt(section, new_data):
-    basedir = os.path.abspath(os.path.dirname(__file__))
-    json_file = basedir + "/lastpass.json"  
-    with open(json_file, mode='r+') as feedsjson:
-        feeds = json.load(feedsjson)
-        feeds[section] = str(new_data)
-        feedsjson.seek(0)
-        feedsjson.write(json.dumps(feeds))
-        feedsjson.truncate()
+    with open(JSON_FILE, mode='rb') as feedsjson:
+        feeds = json_loads(feedsjson.read())
+    feeds[section] = new_data
+    # Write to a sibling file and swap it in, so a crash never leaves a truncated feed
+    temp_json_file = JSON_FILE + '.tmp'
+    with open(temp_json_file, mode='wb') as feedsjson:
+        json_dump(feeds, feedsjson)
+    os.replace(temp_json_file, JSON_FILE)
     return 1
 
 # Read data from the Writable Stream
 def read_in():
-    lines = sys.stdin.readlines()
-    return json.loads(lines[0])
+    # Only the first line carries the request; don't buffer the rest of the stream
+    line = sys.stdin.buffer.readline()
+    # The method is almost always a bare integer, which needs no JSON parsing
+    try:
+        return int(line)
+    except ValueError:
+        return int(json_loads(line))
+
+# The seed Ursula is fetched lazily, once the certificate directory exists
+_URSULA = None
+
+def getUrsula():
+    from nucypher.characters.lawful import Ursula
+    global _URSULA
+    if _URSULA is None:
+        _URSULA = Ursula.from_seed_and_stake_info(host=TESTNET_LOAD_BALANCER,
+                                                  certificates_directory=TEMP_CERTIFICATE_DIR,
+                                                  federated_only=True,
+                                                  minimum_stake=0)
+    return _URSULA
+
+# Characters are built once per process and reused, so repeated calls skip node bootstrap
+_ALICE = None
+_BOB = None
 
 def getAlice():
-    ALICE = Alice(network_middleware=RestMiddleware(),
-              known_nodes=[ursula],
-              learn_on_same_thread=True,
-              federated_only=True,
-              known_certificates_dir=TEMP_CERTIFICATE_DIR) 
-    return ALICE
+    from nucypher.characters.lawful import Alice
+    from nucypher.network.middleware import RestMiddleware
+    global _ALICE
+    if _ALICE is None:
+        _ALICE = Alice(network_middleware=RestMiddleware(),
+                       known_nodes=[getUrsula()],
+                       learn_on_same_thread=True,
+                       federated_only=True,
+                       known_certificates_dir=TEMP_CERTIFICATE_DIR)
+        _ALICE.start_learning_loop(now=True)
+    return _ALICE
 
 def getBob():
-    BOB = Bob(known_nodes=[ursula],
-              network_middleware=RestMiddleware(),
-              federated_only=True,
-              start_learning_now=True,
-              learn_on_same_thread=True,
-              known_certificates_dir=TEMP_CERTIFICATE_DIR) 
-    return BOB
+    from nucypher.characters.lawful import Bob
+    from nucypher.network.middleware import RestMiddleware
+    global _BOB
+    if _BOB is None:
+        _BOB = Bob(known_nodes=[getUrsula()],
+                   network_middleware=RestMiddleware(),
+                   federated_only=True,
+                   start_learning_now=True,
+                   learn_on_same_thread=True,
+                   known_certificates_dir=TEMP_CERTIFICATE_DIR)
+    return _BOB
+
+# Granted once and reused until it nears expiration; Alice and Bob only live as long as
+# this process, so the policy cannot outlive it either.
+_POLICY = None
+
+def getPolicy(ALICE, BOB):
+    import maya
+    global _POLICY, policy_end_datetime
+    now = time.time()
+    if _POLICY is None or now > policy_end_datetime.epoch - POLICY_RENEWAL_MARGIN:
+        policy_end_datetime = maya.MayaDT(now + POLICY_DURATION)
+        _POLICY = ALICE.grant(BOB,
+                              label,
+                              m=m, n=n,
+                              expiration=policy_end_datetime)
+        # Alice puts her public key somewhere for Bob to find later...
+        BOB.join_policy(label, bytes(ALICE.stamp))
+    return _POLICY
+
+# Each encryption worker process rebuilds the same Enrico once, from the serialized keys
+_WORKER_ENRICO = None
+
+def _init_encryption_worker(policy_pubkey_bytes, signing_key_bytes):
+    from nucypher.data_sources import DataSource as Enrico
+    from nucypher.keystore.keypairs import SigningKeypair
+    from umbral.keys import UmbralPrivateKey, UmbralPublicKey
+    global _WORKER_ENRICO
+    signing_keypair = SigningKeypair(private_key=UmbralPrivateKey.from_bytes(signing_key_bytes))
+    _WORKER_ENRICO = Enrico(policy_pubkey_enc=UmbralPublicKey.from_bytes(policy_pubkey_bytes),
+                            signing_keypair=signing_keypair)
+
+def _encrypt_passages(plaintexts):
+    ciphertexts = []
+    for plaintext in plaintexts:
+        single_passage_ciphertext, _signature = _WORKER_ENRICO.encapsulate_single_message(plaintext)
+        ciphertexts.append(single_passage_ciphertext.to_bytes())
+    return ciphertexts
 
 # API
 def main():
+    from nucypher.crypto.kits import UmbralMessageKit
+    from nucypher.data_sources import DataSource as Enrico
+    from nucypher.keystore.keypairs import SigningKeypair
+    from umbral.keys import UmbralPrivateKey
+
     # Get method
-    data_input = int(read_in())
-    sys.stdout.write(str("hoihoihoi"))
-    basedir = os.path.abspath(os.path.dirname(__file__))
-    json_file = basedir + "/lastpass.json" 
-    json_string = """"""
-    sys.stdout.write(str("hoihoihoi"))
+    data_input = read_in()
     ALICE = getAlice()
-    BOB = getBob()    
-    ALICE.start_learning_loop(now=True)  
-    policy = ALICE.grant(BOB,
-                  label,
-                  m=m, n=n,
-                   expiration=policy_end_datetime)
-    # Alice puts her public key somewhere for Bob to find later...
-    alices_pubkey_bytes_saved_for_posterity = bytes(ALICE.stamp)
-    # ...and then disappears from the internet.
-    del ALICE
-    BOB.join_policy(label, alices_pubkey_bytes_saved_for_posterity)
-    with open(BOOK_PATH, 'rb') as file:
-        finnegans_wake = file.readlines()
-    for counter, plaintext in enumerate(finnegans_wake):
-        #########################
-        # Enrico, the Encryptor #
-        #########################
-        enciro = Enrico(policy_pubkey_enc=policy.public_key)
-        # In this case, the plaintext is a
+    BOB = getBob()
+    policy = getPolicy(ALICE, BOB)
+
+    #########################
+    # Enrico, the Encryptor #
+    #########################
+    # A single Enrico encrypts every passage under the policy public key.
+    enrico_signing_key = UmbralPrivateKey.gen_key()
+    enciro = Enrico(policy_pubkey_enc=policy.public_key,
+                    signing_keypair=SigningKeypair(private_key=enrico_signing_key))
+    data_source_public_key = bytes(enciro.stamp)
+
+    ###############
+    # Back to Bob #
+    ###############
+    enrico_as_understood_by_bob = Enrico.from_public_keys(
+        policy_public_key=policy.public_key,
+        datasource_public_key=data_source_public_key,
+        label=label
+    )
+    # Bob already holds Alice's stamp from joining the policy, so take the key object it wraps
+    # instead of decompressing it again from bytes.
+    alice_pubkey_restored_from_ancient_scroll = ALICE.stamp.as_umbral_pubkey()
+
+    # Now Bob can retrieve the original messages.
+    def retrieve_passage(single_passage_ciphertext):
+        delivered_cleartexts = BOB.retrieve(message_kit=single_passage_ciphertext,
+                                            data_source=enrico_as_understood_by_bob,
+                                            alice_verifying_key=alice_pubkey_restored_from_ancient_scroll)
+        return delivered_cleartexts[0]
+
+    # Encryption is CPU-bound and fans out over processes; retrieval is dominated by
+    # round-trips to Ursulas, so those overlap on threads.  Workers are spawned rather than
+    # forked from this process, whose learning and message-writer threads may hold locks.
+    encryption_executor = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"),
+                                              initializer=_init_encryption_worker,
+                                              initargs=(bytes(policy.public_key), enrico_signing_key.to_bytes()))
+
+    def retrieve_encrypted_passage(encryption, index):
+        single_passage_ciphertext = UmbralMessageKit.from_bytes(encryption.result()[index])
+        return retrieve_passage(single_passage_ciphertext)
+
+    def emit_passage(counter, plaintext, retrieval):
+        delivered_cleartext = retrieval.result()
+        # We show that indeed this is the passage originally encrypted by Enrico.
+        assert plaintext == delivered_cleartext
+        # \s+ already covers tabs and line breaks, so one substitution pass suffices
+        passage = WHITESPACE_PATTERN.sub(b' ', delivered_cleartext).strip()
+        json_dump({"passage": counter, "text": passage.decode()}, sys.stdout.buffer)
+
+    with encryption_executor, ThreadPoolExecutor(max_workers=RETRIEVAL_WORKERS) as executor, \
+            open(BOOK_PATH, 'rb', buffering=BOOK_BUFFER_SIZE) as file:
+
+        # In this case, each plaintext is a
         # single passage from James Joyce's Finnegan's Wake.
         # The matter of whether encryption makes the passage more or less readable
         # is left to the reader to determine.
-        single_passage_ciphertext, _signature = enciro.encapsulate_single_message(plaintext)
-        data_source_public_key = bytes(enciro.stamp)
-        del enciro
-        ###############
-        # Back to Bob #
-        ###############
-        enrico_as_understood_by_bob = Enrico.from_public_keys(
-            policy_public_key=policy.public_key,
-            datasource_public_key=data_source_public_key,
-            label=label
-        )
-        # Now Bob can retrieve the original message.
-        alice_pubkey_restored_from_ancient_scroll = UmbralPublicKey.from_bytes(alices_pubkey_bytes_saved_for_posterity)
-        delivered_cleartexts = BOB.retrieve(message_kit=single_passage_ciphertext,
-                                    data_source=enrico_as_understood_by_bob,
-                                    alice_verifying_key=alice_pubkey_restored_from_ancient_scroll)
+        #
+        # The book is streamed: passages are read a chunk at a time, each chunk is encrypted as one
+        # task, and each passage is retrieved as soon as its chunk is.  Passages are emitted as
+        # JSON Lines records in order, and only the ones still in flight are held in memory.
+        passages = enumerate(file)
+        in_flight = deque()
+        while True:
+            chunk = list(islice(passages, ENCRYPTION_CHUNKSIZE))
+            if not chunk:
+                break
+            encryption = encryption_executor.submit(_encrypt_passages, [plaintext for _counter, plaintext in chunk])
+            for index, (counter, plaintext) in enumerate(chunk):
+                retrieval = executor.submit(retrieve_encrypted_passage, encryption, index)
+                if counter == 0:
+                    # On a cold start, let the first retrieval follow the treasure map and learn its
+                    # Ursulas on its own before the rest fan out.
+                    wait((retrieval,))
+                in_flight.append((counter, plaintext, retrieval))
+            while len(in_flight) > PASSAGES_IN_FLIGHT:
+                emit_passage(*in_flight.popleft())
+        while in_flight:
+            emit_passage(*in_flight.popleft())
 
-        # We show that indeed this is the passage originally encrypted by Enrico.
-        assert plaintext == delivered_cleartexts[0]
-        json_string = json_string + format(delivered_cleartexts[0])
-        json_string1 = re.sub(r'\s+', ' ', json_string) 
-        json_string1 = re.sub(r'$|\t|\n|\r', '', json_string1)         
-        print(json_string1.replace('b\'', '').replace('\'', '"')) 
-        jso = json_string1.replace('b\'', '').replace('}\'', '}')
-        #Convert string to json & render a template
-        passwords = json.loads(jso)      
-        sys.stdout.write(str(json.dumps(passwords)))
-
-        
 # Start the process
 if __name__ == '__main__':
+    from twisted.logger import globalLogPublisher
+    from nucypher.utilities.logging import simpleObserver
+
+    # Twisted Logger
+    globalLogPublisher.addObserver(simpleObserver)
+
+    # Keep demo files (and the Ursula certificates cached in them) between runs
+    os.makedirs(TEMP_CERTIFICATE_DIR, exist_ok=True)
     main()
 
 
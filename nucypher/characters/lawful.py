@@ -16,6 +16,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import binascii
 import random
+import threading
 from collections import OrderedDict
 from functools import partial
 from typing import Iterable, Callable
@@ -172,6 +173,7 @@ class Bob(Character):
 
         from nucypher.policy.models import WorkOrderHistory  # Need a bigger strategy to avoid circulars.
         self._saved_work_orders = WorkOrderHistory()
+        self._retrieval_lock = threading.Lock()  # Treasure map following and work order bookkeeping, across retrieving threads
 
     def peek_at_treasure_map(self, treasure_map=None, map_id=None):
         """
@@ -343,10 +345,11 @@ class Bob(Character):
 
     def get_reencrypted_cfrags(self, work_order):
         cfrags = self.network_middleware.reencrypt(work_order)
-        for counter, capsule in enumerate(work_order.capsules):
-            # TODO: Maybe just update the work order here instead of setting it anew.
-            work_orders_by_ursula = self._saved_work_orders[work_order.ursula.checksum_public_address]
-            work_orders_by_ursula[capsule] = work_order
+        with self._retrieval_lock:
+            for counter, capsule in enumerate(work_order.capsules):
+                # TODO: Maybe just update the work order here instead of setting it anew.
+                work_orders_by_ursula = self._saved_work_orders[work_order.ursula.checksum_public_address]
+                work_orders_by_ursula[capsule] = work_order
         return cfrags
 
     def get_ursula(self, ursula_id):
@@ -366,9 +369,12 @@ class Bob(Character):
             verifying=alice_verifying_key)
 
         hrac, map_id = self.construct_hrac_and_map_id(alice_verifying_key, data_source.label)
-        _unknown_ursulas, _known_ursulas, m = self.follow_treasure_map(map_id=map_id, block=True)
 
-        work_orders = self.generate_work_orders(map_id, message_kit.capsule)
+        # Learning, fetching the treasure map and the saved work orders aren't safe to share between threads;
+        # only the reencryption round-trips below overlap when several threads retrieve at once.
+        with self._retrieval_lock:
+            _unknown_ursulas, _known_ursulas, m = self.follow_treasure_map(map_id=map_id, block=True)
+            work_orders = self.generate_work_orders(map_id, message_kit.capsule)
 
         cleartexts = []
 
@@ -392,15 +398,121 @@ class Bob(Character):
         return cleartexts
 
 
+def _compile_node_splitter(layout: tuple) -> Callable:
+    """
+    Generate a function that splits one node laid out as described into raw fields, with
+    every fixed offset inlined.  Fields are (name, length) pairs where length is a byte count
+    or VariableLengthBytestring; an optional third element of int decodes the field big-endian.
+    The generated function takes (data, offset=0) and returns (fields, offset past the node).
+    """
+    lines = ["def split_raw(data, offset=0):"]
+    position = 0  # Bytes past `offset` that the fields read so far have covered
+    for field in layout:
+        name, length = field[:2]
+        if length is VariableLengthBytestring:
+            lines.append("    {}_length = int.from_bytes(data[offset + {}:offset + {}], 'big')"
+                         .format(name, position, position + 4))
+            lines.append("    offset += {}".format(position + 4))
+            lines.append("    {0} = data[offset:offset + {0}_length]".format(name))
+            lines.append("    offset += {}_length".format(name))
+            position = 0
+        else:
+            value = "data[offset + {}:offset + {}]".format(position, position + length)
+            if field[2:] == (int,):
+                value = "int.from_bytes({}, 'big')".format(value)
+            lines.append("    {} = {}".format(name, value))
+            position += length
+    if position:
+        lines.append("    offset += {}".format(position))
+    lines.append("    if offset > len(data):")
+    lines.append("        raise ValueError('Node bytes end {} bytes early.'.format(offset - len(data)))")
+    lines.append("    return ({},), offset".format(", ".join(field[0] for field in layout)))
+
+    namespace = dict()
+    exec(compile("\n".join(lines), "<node splitter>", "exec"), namespace)
+    return namespace['split_raw']
+
+
+class UrsulaBytesSplitter:
+    """
+    Ursula's serialized layout (see Ursula.__bytes__), split by a function generated from it
+    with the fixed offsets inlined.  Fields are read by offset instead of dispatching per type.
+
+    Stands in for the equivalent BytestringSplitter: calling it splits one node, and
+    repeat() splits a run of concatenated nodes.
+    """
+    layout = (('timestamp', 4, int),
+              ('signature', Signature.expected_bytes_length()),
+              ('identity_evidence', VariableLengthBytestring),
+              ('verifying_key', PUBLIC_KEY_LENGTH),
+              ('encrypting_key', PUBLIC_KEY_LENGTH),
+              ('public_address', PUBLIC_ADDRESS_LENGTH),
+              ('certificate', VariableLengthBytestring),
+              ('rest_info', VariableLengthBytestring))
+
+    split_raw = staticmethod(_compile_node_splitter(layout))
+
+    @staticmethod
+    def matches_variable_length_framing() -> bool:
+        """
+        Whether bytestringSplitter frames variable-length fields the way this splitter reads them.
+        """
+        return bytes(VariableLengthBytestring(b'\x01')) == (1).to_bytes(4, 'big') + b'\x01'
+
+    @staticmethod
+    def inflate(raw_fields: tuple) -> tuple:
+        timestamp, signature, identity_evidence, \
+        verifying_key, encrypting_key, public_address, \
+        certificate, rest_info = raw_fields
+        return (timestamp,
+                Signature.from_bytes(signature),
+                VariableLengthBytestring(identity_evidence),
+                UmbralPublicKey.from_bytes(verifying_key),
+                UmbralPublicKey.from_bytes(encrypting_key),
+                public_address,
+                VariableLengthBytestring(certificate),
+                InterfaceInfo.from_bytes(rest_info))
+
+    def __call__(self, data: bytes) -> tuple:
+        raw_fields, end = self.split_raw(data)
+        if end != len(data):
+            raise ValueError("{} unexpected bytes after the node.".format(len(data) - end))
+        return self.inflate(raw_fields)
+
+    def repeat(self, data: bytes, skip: Callable[[bytes, int], bool] = None) -> list:
+        """
+        Split concatenated nodes.  Nodes for which skip(canonical_address, timestamp_epoch)
+        is true are passed over before any of their keys or certificates are loaded.
+        """
+        nodes, offset = [], 0
+        while offset < len(data):
+            raw_fields, offset = self.split_raw(data, offset)
+            if skip is not None and skip(raw_fields[5], raw_fields[0]):
+                continue
+            nodes.append(self.inflate(raw_fields))
+        return nodes
+
+
 class Ursula(VerifiableNode, Character, Miner):
-    _internal_splitter = BytestringSplitter((int, 4, {'byteorder': 'big'}),
-                                            Signature,
-                                            VariableLengthBytestring,
-                                            (UmbralPublicKey, PUBLIC_KEY_LENGTH),
-                                            (UmbralPublicKey, PUBLIC_KEY_LENGTH),
-                                            PUBLIC_ADDRESS_LENGTH,
-                                            VariableLengthBytestring,  # Certificate
-                                            InterfaceInfo)
+    _bytestring_splitter = BytestringSplitter((int, 4, {'byteorder': 'big'}),
+                                              Signature,
+                                              VariableLengthBytestring,
+                                              (UmbralPublicKey, PUBLIC_KEY_LENGTH),
+                                              (UmbralPublicKey, PUBLIC_KEY_LENGTH),
+                                              PUBLIC_ADDRESS_LENGTH,
+                                              VariableLengthBytestring,  # Certificate
+                                              InterfaceInfo)
+    if UrsulaBytesSplitter.matches_variable_length_framing():
+        _internal_splitter = UrsulaBytesSplitter()
+    else:
+        _internal_splitter = _bytestring_splitter
+    # verify_node only compares keys, address and evidence; it leaves the keys as bytes and skips the rest.
+    _node_information_splitter = BytestringSplitter((int, 4, {'byteorder': 'big'}),
+                                                    Signature.expected_bytes_length(),
+                                                    VariableLengthBytestring,
+                                                    PUBLIC_KEY_LENGTH,
+                                                    PUBLIC_KEY_LENGTH,
+                                                    PUBLIC_ADDRESS_LENGTH)
     _alice_class = Alice
 
     # TODO: Maybe this wants to be a registry, so that, for example,
@@ -639,13 +751,22 @@ class Ursula(VerifiableNode, Character, Miner):
     def batch_from_bytes(cls,
                          ursulas_as_bytes: Iterable[bytes],
                          federated_only: bool = False,
+                         skip: Callable[[bytes, int], bool] = None,
                          ) -> List['Ursula']:
+        """
+        Nodes for which skip(canonical_address, timestamp_epoch) is true are left out.
+        """
 
         # TODO: Make a better splitter for this.  This is a workaround until bytestringSplitter #8 is closed.
 
         stranger_ursulas = []
 
-        ursulas_attrs = cls._internal_splitter.repeat(ursulas_as_bytes)
+        if isinstance(cls._internal_splitter, UrsulaBytesSplitter):
+            ursulas_attrs = cls._internal_splitter.repeat(ursulas_as_bytes, skip=skip)
+        else:
+            ursulas_attrs = cls._internal_splitter.repeat(ursulas_as_bytes)
+            if skip is not None:
+                ursulas_attrs = [attrs for attrs in ursulas_attrs if not skip(attrs[5], attrs[0])]
         for (timestamp,
              signature,
              identity_evidence,
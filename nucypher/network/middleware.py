@@ -22,6 +22,7 @@ import time
 from bytestring_splitter import BytestringSplitter, VariableLengthBytestring
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
+from requests.adapters import HTTPAdapter
 from twisted.logger import Logger
 from umbral.fragments import CapsuleFrag
 from umbral.signing import Signature
@@ -30,11 +31,21 @@ from umbral.signing import Signature
 class RestMiddleware:
     log = Logger()
 
+    _POOL_CONNECTIONS = 32  # Distinct node interfaces to keep connections for
+    _POOL_MAXSIZE = 64  # Kept-alive connections per interface
+
+    def __init__(self):
+        # Keep TLS connections to nodes alive between requests instead of handshaking for every call.
+        # urllib3 pools by host, port and the certificate used for verification.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self._POOL_CONNECTIONS, pool_maxsize=self._POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+
     def consider_arrangement(self, arrangement):
         node = arrangement.ursula
-        response = requests.post("https://{}/consider_arrangement".format(node.rest_interface),
-                                 bytes(arrangement),
-                                 verify=node.certificate_filepath, timeout=2)
+        response = self.session.post("https://{}/consider_arrangement".format(node.rest_interface),
+                                      bytes(arrangement),
+                                      verify=node.certificate_filepath, timeout=2)
 
         if not response.status_code == 200:
             raise RuntimeError("Bad response: {}".format(response.content))
@@ -63,8 +74,8 @@ class RestMiddleware:
             return certificate
 
     def enact_policy(self, ursula, id, payload):
-        response = requests.post('https://{}/kFrag/{}'.format(ursula.rest_interface, id.hex()), payload,
-                                 verify=ursula.certificate_filepath, timeout=2)
+        response = self.session.post('https://{}/kFrag/{}'.format(ursula.rest_interface, id.hex()), payload,
+                                      verify=ursula.certificate_filepath, timeout=2)
         if not response.status_code == 200:
             raise RuntimeError("Bad response: {}".format(response.content))
         return True, ursula.stamp.as_umbral_pubkey()
@@ -82,23 +93,23 @@ class RestMiddleware:
 
     def get_treasure_map_from_node(self, node, map_id):
         endpoint = "https://{}/treasure_map/{}".format(node.rest_interface, map_id)
-        response = requests.get(endpoint, verify=node.certificate_filepath, timeout=2)
+        response = self.session.get(endpoint, verify=node.certificate_filepath, timeout=2)
         return response
 
     def put_treasure_map_on_node(self, node, map_id, map_payload):
         endpoint = "https://{}/treasure_map/{}".format(node.rest_interface, map_id)
-        response = requests.post(endpoint, data=map_payload, verify=node.certificate_filepath, timeout=2)
+        response = self.session.post(endpoint, data=map_payload, verify=node.certificate_filepath, timeout=2)
         return response
 
     def send_work_order_payload_to_ursula(self, work_order):
         payload = work_order.payload()
         id_as_hex = work_order.arrangement_id.hex()
         endpoint = 'https://{}/kFrag/{}/reencrypt'.format(work_order.ursula.rest_interface, id_as_hex)
-        return requests.post(endpoint, payload, verify=work_order.ursula.certificate_filepath, timeout=2)
+        return self.session.post(endpoint, payload, verify=work_order.ursula.certificate_filepath, timeout=2)
 
     def node_information(self, host, port, certificate_filepath):
         endpoint = "https://{}:{}/public_information".format(host, port)
-        return requests.get(endpoint, verify=certificate_filepath, timeout=2)
+        return self.session.get(endpoint, verify=certificate_filepath, timeout=2)
 
     def get_nodes_via_rest(self,
                            url,
@@ -113,10 +124,10 @@ class RestMiddleware:
 
         if announce_nodes:
             payload = bytes().join(bytes(n) for n in announce_nodes)
-            response = requests.post("https://{}/node_metadata".format(url),
-                                     verify=certificate_filepath,
-                                     data=payload, timeout=2)
+            response = self.session.post("https://{}/node_metadata".format(url),
+                                          verify=certificate_filepath,
+                                          data=payload, timeout=2)
         else:
-            response = requests.get("https://{}/node_metadata".format(url),
-                                    verify=certificate_filepath, timeout=2)
+            response = self.session.get("https://{}/node_metadata".format(url),
+                                         verify=certificate_filepath, timeout=2)
         return response
@@ -14,10 +14,14 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import atexit
+import hashlib
 import os
 import random
-from collections import defaultdict
-from collections import deque
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import suppress
 from logging import Logger
 from tempfile import TemporaryDirectory
@@ -53,20 +57,148 @@ import json
 import struct
 import datetime
 
-def get_sysdate():  
-    now = datetime.datetime.now()
-    return str(now)
+# Log lines emitted within the same tick share a timestamp: (time of last refresh, date string, date bytes).
+# The tuple is swapped in whole, so threads logging concurrently never see a half-updated date.
+_SYSDATE_CACHE = (0.0, "", b"")
+_SYSDATE_RESOLUTION = 0.01  # seconds
+
+def _current_sysdate():
+    global _SYSDATE_CACHE
+    cached = _SYSDATE_CACHE
+    now = time.time()
+    if now - cached[0] > _SYSDATE_RESOLUTION:
+        sysdate = str(datetime.datetime.fromtimestamp(now))
+        cached = _SYSDATE_CACHE = (now, sysdate, sysdate.encode())
+    return cached
+
+def get_sysdate():
+    return _current_sysdate()[1]
+
+def get_sysdate_bytes():
+    return _current_sysdate()[2]
     
+_MESSAGE_LENGTH = struct.Struct('@I')
+
 def encodeMessage(messageContent):
     encodedContent = json.dumps(messageContent).encode('utf-8')
-    encodedLength = struct.pack('@I', len(encodedContent))
-    return {'length': encodedLength, 'content': encodedContent}
-
-# Send an encoded message to stdout
+    return _MESSAGE_LENGTH.pack(len(encodedContent)) + encodedContent
+
+# Encoded messages and unformatted log records waiting for the writer thread;
+# when full, the oldest entries are dropped (and counted) so that senders never wait on the pipe
+_MESSAGE_RING = deque(maxlen=8192)
+_MESSAGE_RING_READY = threading.Condition()
+_MESSAGE_RING_DROPPED = 0  # Entries pushed out of the full ring since the writer last reported
+_MESSAGE_WRITE_LOCK = threading.Lock()  # Keeps batches in order between the writer thread and the exit flush
+_MESSAGE_WRITER_PID = None  # Process the writer thread was started in
+
+def _flush_message_ring():
+    global _MESSAGE_RING_DROPPED
+    with _MESSAGE_WRITE_LOCK:
+        with _MESSAGE_RING_READY:
+            entries = tuple(_MESSAGE_RING)
+            _MESSAGE_RING.clear()
+            dropped, _MESSAGE_RING_DROPPED = _MESSAGE_RING_DROPPED, 0
+        if dropped:
+            entries = (("Warn", get_sysdate_bytes(), "Dropped {} messages while stdout was backed up.", (dropped,)),) + entries
+        batch = b''.join(entry if isinstance(entry, bytes) else _frame_log_record(*entry) for entry in entries)
+        if batch:
+            sys.stdout.buffer.write(batch)
+            sys.stdout.buffer.flush()
+
+def _message_writer():
+    # Write everything that piled up while the last batch was being written, with one flush per batch
+    while True:
+        with _MESSAGE_RING_READY:
+            _MESSAGE_RING_READY.wait_for(lambda: _MESSAGE_RING)
+        _flush_message_ring()
+
+atexit.register(_flush_message_ring)
+
+def _enqueue_message(entry):
+    global _MESSAGE_WRITER_PID, _MESSAGE_RING_DROPPED
+    with _MESSAGE_RING_READY:
+        if _MESSAGE_WRITER_PID != os.getpid():  # Not started yet, or this is a forked child without the thread
+            _MESSAGE_WRITER_PID = os.getpid()
+            threading.Thread(target=_message_writer, name="nucypher-message-writer", daemon=True).start()
+        if len(_MESSAGE_RING) == _MESSAGE_RING.maxlen:
+            _MESSAGE_RING_DROPPED += 1  # append() pushes the oldest entry out
+        _MESSAGE_RING.append(entry)
+        _MESSAGE_RING_READY.notify()
+
+# Queue an encoded message for stdout; the reactor never blocks on the pipe
 def sendMessage(encodedMessage):
-    sys.stdout.buffer.write(encodedMessage['length'])
-    sys.stdout.buffer.write(encodedMessage['content'])
-    sys.stdout.buffer.flush()
+    _enqueue_message(encodedMessage)
+
+def _send_str(messageContent):
+    sendMessage(encodeMessage(messageContent))
+
+# Levels to emit, e.g. NUCYPHER_LOG_LEVELS=Debug,Info,Warn,Critical
+_ACTIVE_LEVELS = frozenset(os.environ.get('NUCYPHER_LOG_LEVELS', 'Info,Warn,Critical').split(','))
+
+# JSON-encoded "log:Level:<level>, Date:" without its closing quote; the date never needs escaping
+_LEVEL_PREFIXES = {level: json.dumps("log:Level:{}, Date:".format(level))[:-1].encode('utf-8')
+                   for level in ('Debug', 'Info', 'Warn', 'Critical', 'Error')}
+
+def _frame_log_record(level, sysdate_bytes, message, args):
+    if args:
+        try:
+            message = message.format(*args)
+        except Exception:  # A bad record must not take the writer thread down with it
+            message = "{} {!r}".format(message, args)
+    # The JSON-encoded message minus its opening quote completes the level prefix; the frame matches _send_str's
+    content = b''.join((_LEVEL_PREFIXES[level], sysdate_bytes, b', Message: ', json.dumps(message)[1:].encode('utf-8')))
+    return _MESSAGE_LENGTH.pack(len(content)) + content
+
+def _log(level, message, *args):
+    # Like the logging module, skip disabled levels outright.  Enabled records are dated here
+    # but formatted and encoded on the writer thread.
+    if level in _ACTIVE_LEVELS:
+        _enqueue_message((level, get_sysdate_bytes(), message, args))
+
+FLEET_STATE_ICON_TEMPLATE = ('<div class="nucypher-nickname-icon" style="border-color:%(color)s;">'
+                             '<span class="symbol" style="color: %(color)s">%(symbol)s</span>'
+                             '<br/>'
+                             '<span class="small-address">%(fleet_state_checksum)s</span>'
+                             '</div>')
+
+NICKNAME_ICON_TEMPLATE = ('<div class="nucypher-nickname-icon" style="border-top-color:{first_color}; '
+                          'border-left-color:{first_color}; border-bottom-color:{second_color}; '
+                          'border-right-color:{second_color};">'
+                          '<span class="symbol" style="color: {first_color}">{first_symbol}</span>'
+                          '<span class="symbol" style="color: {second_color}">{second_symbol}</span>'
+                          '<br/>'
+                          '<span class="small-address">{address_first6}</span>'
+                          '</div>')
+
+
+def _merkle_levels(leaves: list) -> list:
+    """
+    Build every level of a binary Merkle tree, leaves first and root last.
+    An unpaired hash at the end of a level is carried up as is.
+    """
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        above = [keccak_digest(below[index], below[index + 1]) for index in range(0, len(below) - 1, 2)]
+        if len(below) % 2:
+            above.append(below[-1])
+        levels.append(above)
+    return levels
+
+def _update_merkle_leaf(levels: list, position: int, leaf_hash: bytes) -> None:
+    """
+    Replace one leaf and re-hash only its ancestors.
+    """
+    levels[0][position] = leaf_hash
+    for depth in range(1, len(levels)):
+        below = levels[depth - 1]
+        position //= 2
+        left = position * 2
+        if left + 1 < len(below):
+            levels[depth][position] = keccak_digest(below[left], below[left + 1])
+        else:
+            levels[depth][position] = below[left]
+
 
 class FleetState(dict):
     """
@@ -79,8 +211,39 @@ class FleetState(dict):
 
     def __init__(self, *args, **kwargs):
         dict.__init__(self, *args, **kwargs)
+        self.sorted_addresses = sorted(self)  # Kept in order as nodes are added; don't mutate from outside.
+        self._sorted_nodes = None
+        self.membership_version = 0  # Bumped whenever an address joins or leaves the fleet
+        self.refreshed_addresses = set()  # Known addresses whose node was replaced since the last checksum
         self.updated = maya.now()
 
+    def __setitem__(self, checksum_address, node):
+        if checksum_address not in self:
+            insort(self.sorted_addresses, checksum_address)
+            self.membership_version += 1
+        else:
+            self.refreshed_addresses.add(checksum_address)
+        dict.__setitem__(self, checksum_address, node)
+        self._sorted_nodes = None
+
+    def __delitem__(self, checksum_address):
+        dict.__delitem__(self, checksum_address)
+        del self.sorted_addresses[bisect_left(self.sorted_addresses, checksum_address)]
+        self.membership_version += 1
+        self._sorted_nodes = None
+
+    def update(self, *args, **kwargs):
+        for checksum_address, node in dict(*args, **kwargs).items():
+            self[checksum_address] = node
+
+    def sorted_nodes(self) -> tuple:
+        """
+        The known nodes, ordered by checksum address.  The view is cached until the fleet changes.
+        """
+        if self._sorted_nodes is None:
+            self._sorted_nodes = tuple(dict.__getitem__(self, address) for address in self.sorted_addresses)
+        return self._sorted_nodes
+
     @property
     def checksum(self):
         return self._checksum
@@ -101,20 +264,25 @@ class FleetState(dict):
     def icon(self):
         if self.checksum is constants.NO_KNOWN_NODES:
             return "NO FLEET STATE AVAILABLE"
-        icon_template = """
-        <div class="nucypher-nickname-icon" style="border-color:{color};">
-        <span class="symbol" style="color: {color}">{symbol}</span>
-        <br/>
-        <span class="small-address">{fleet_state_checksum}</span>
-        </div>
-        """.replace("  ", "").replace('\n', "")
-        return icon_template.format(
+        return FLEET_STATE_ICON_TEMPLATE % dict(
             color=self.nickname_metadata[0][0]['hex'],
             symbol=self.nickname_metadata[0][1],
             fleet_state_checksum=self.checksum[0:8]
         )
 
 
+class _DiscoveryListener:
+    """
+    Learning listener that crosses awaited addresses off as remember_node reports them.
+    """
+
+    def __init__(self, awaited: Set):
+        self.awaited = awaited
+
+    def add(self, address):
+        self.awaited.discard(address)
+
+
 class Learner:
     """
     Any participant in the "learning loop" - a class inheriting from
@@ -127,17 +295,28 @@ class Learner:
     _LONG_LEARNING_DELAY = 90
     LEARNING_TIMEOUT = 10
     _ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN = 10
+    _VERIFICATION_WORKERS = 16
+    _TEACHER_BATCH_SIZE = 32
+    _SEED_VERIFICATION_TTL = 60 * 10  # Seconds a verified seednode stays trusted while its certificate is unchanged
+    _SAME_THREAD_LEARNING_INTERVAL = .1  # Seconds between rounds when a blocking caller learns on its own thread
 
     # For Keeps
     __DEFAULT_NODE_STORAGE = InMemoryNodeStorage
     __DEFAULT_MIDDLEWARE_CLASS = RestMiddleware
 
+    # Whether this class is itself a VerifiableNode that can announce itself to teachers; see __init_subclass__.
+    _IS_VERIFIABLE = False
+
     class NotEnoughTeachers(RuntimeError):
         pass
 
     class UnresponsiveTeacher(ConnectionError):
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._IS_VERIFIABLE = VerifiableNode in cls.__bases__
+
     def __init__(self,
                  network_middleware: RestMiddleware = __DEFAULT_MIDDLEWARE_CLASS(),
                  start_learning_now: bool = False,
@@ -162,6 +341,20 @@ class Learner:
 
         self.known_certificates_dir = known_certificates_dir or TemporaryDirectory("nucypher-tmp-certs-").name
         self.__known_nodes = FleetState()
+        self._known_node_timestamps = {}  # canonical address -> epoch of the copy we know; checked against raw teacher bytes
+        self._node_leaf_hashes = {}  # checksum address -> (timestamp, keccak(bytes(node)))
+        self._fleet_tree = None  # Merkle levels over the sorted nodes' leaf hashes, leaves first
+        self._fleet_tree_positions = {}  # checksum address -> leaf index
+        self._fleet_tree_version = None  # FleetState.membership_version the tree was built for
+        self._fleet_tree_lock = threading.Lock()
+        self._announce_nodes = [self] if self._IS_VERIFIABLE else None  # Sent along with every learning request
+        self._teacher_permutation = None  # Sampled batch of teacher addresses; redrawn when spent or a new node is remembered
+        self._teacher_index = 0
+        self._node_discovery = threading.Condition()  # Notified whenever a node is remembered, or learning crashes or stops
+        self._node_discovery_count = 0
+        self._remembering = threading.Lock()  # Guards known node bookkeeping in remember_node
+        self._certificate_filepaths = {}  # checksum address -> certificate path in known_certificates_dir
+        self._saved_certificates = {}  # checksum address -> fingerprint of the certificate written for it
 
         self.done_seeding = False
 
@@ -183,13 +376,14 @@ class Learner:
             except self.UnresponsiveTeacher:
                 self.unresponsive_startup_nodes.append(node)
 
-        self.teacher_nodes = deque()
         self._current_teacher_node = None  # type: Teacher
         self._learning_task = task.LoopingCall(self.keep_learning_about_nodes)
         self._learning_round = 0  # type: int
         self._rounds_without_new_nodes = 0  # type: int
         self._seed_nodes = seed_nodes or []
-        self.unresponsive_seed_nodes = set()
+        self._verification_pool = ThreadPoolExecutor(max_workers=self._VERIFICATION_WORKERS)
+        self.unresponsive_seed_nodes = list()  # Only ever a handful of seednodes; a list scan beats hashing
+        self._seed_verify_cache = {}  # (host, port, certificate fingerprint) -> (verified at, seed node)
 
         if self.start_learning_now:
             self.start_learning_loop(now=self.learn_on_same_thread)
@@ -207,34 +401,62 @@ class Learner:
         Engage known nodes from storages and pre-fetch hardcoded seednode certificates for node learning.
         """
         if self.done_seeding:
-            sendMessage(encodeMessage("log:Level:Debug, Date:{}, Message:Already done seeding; won't try again.".format(get_sysdate())))
+            _log("Debug", "Already done seeding; won't try again.")
             #self.log.debug("Already done seeding; won't try again.")
             return
 
-        def __attempt_seednode_learning(seednode_metadata, current_attempt=1):
+        def __fetch_seednode(seednode_metadata):
             from nucypher.characters.lawful import Ursula
-            sendMessage(encodeMessage("log:Level:Debug, Date:{}, Message:Seeding from: {}|{}:{}".format(get_sysdate(), seednode_metadata.checksum_address,seednode_metadata.rest_host,seednode_metadata.rest_port)))
+            _log("Debug", "Seeding from: {}|{}:{}", seednode_metadata.checksum_address, seednode_metadata.rest_host, seednode_metadata.rest_port)
             #self.log.debug(
             #    "Seeding from: {}|{}:{}".format(seednode_metadata.checksum_address,
              #                                   seednode_metadata.rest_host,
              #                                   seednode_metadata.rest_port))
 
-            seed_node = Ursula.from_seednode_metadata(seednode_metadata=seednode_metadata,
-                                                      network_middleware=self.network_middleware,
-                                                      certificates_directory=self.known_certificates_dir,
-                                                      timeout=timeout,
-                                                      federated_only=self.federated_only)  # TODO: 466
+            host, port = seednode_metadata.rest_host, seednode_metadata.rest_port
+            certificate = self.network_middleware.get_certificate(host=host, port=port)
+            cache_key = (host, port, _certificate_fingerprint(certificate))
+            verified_at, seed_node = self._seed_verify_cache.get(cache_key, (None, None))
+
+            # Same certificate on the same interface: skip re-parsing and re-verifying the node.
+            if verified_at is None or time.monotonic() - verified_at > self._SEED_VERIFICATION_TTL:
+                try:
+                    seed_node = Ursula.from_seednode_metadata(seednode_metadata=seednode_metadata,
+                                                              network_middleware=self.network_middleware,
+                                                              certificates_directory=self.known_certificates_dir,
+                                                              certificate=certificate,
+                                                              timeout=timeout,
+                                                              federated_only=self.federated_only)  # TODO: 466
+                except SSLError:
+                    for key in [k for k in list(self._seed_verify_cache) if k[:2] == (host, port)]:
+                        self._seed_verify_cache.pop(key, None)
+                    raise
+                if seed_node is not False:
+                    self._seed_verify_cache[cache_key] = (time.monotonic(), seed_node)
+            return seed_node
+
+        def __try_seednode(seednode_metadata):
+            # One bad seednode mustn't cost us the others fetched alongside it; count it as unresponsive instead.
+            try:
+                return __fetch_seednode(seednode_metadata)
+            except Exception as e:
+                _log("Warn", "Failed to seed from {}:{}: {!r}", seednode_metadata.rest_host, seednode_metadata.rest_port, e)
+                return False
+
+        # Fetching and verifying a seednode is a few network round-trips; reach all of them at once.
+        seed_nodes = list(self._verification_pool.map(__try_seednode, self._seed_nodes))
+
+        for seednode_metadata, seed_node in zip(self._seed_nodes, seed_nodes):
             if seed_node is False:
-                self.unresponsive_seed_nodes.add(seednode_metadata)
+                if seednode_metadata not in self.unresponsive_seed_nodes:
+                    self.unresponsive_seed_nodes.append(seednode_metadata)
             else:
-                self.unresponsive_seed_nodes.discard(seednode_metadata)
+                with suppress(ValueError):
+                    self.unresponsive_seed_nodes.remove(seednode_metadata)
                 self.remember_node(seed_node)
 
-        for seednode_metadata in self._seed_nodes:
-            __attempt_seednode_learning(seednode_metadata=seednode_metadata)
-
         if not self.unresponsive_seed_nodes:
-            sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Finished learning about all seednodes.".format(get_sysdate())))
+            _log("Info", "Finished learning about all seednodes.")
             #self.log.info("Finished learning about all seednodes.")
         self.done_seeding = True
 
@@ -242,7 +464,7 @@ class Learner:
             self.read_nodes_from_storage()
 
         if not self.known_nodes:
-            sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: No seednodes were available after {} attempts".format(get_sysdate(), retry_attempts)))
+            _log("Warn", "No seednodes were available after {} attempts", retry_attempts)
             #self.log.warn("No seednodes were available after {} attempts".format(retry_attempts))
             # TODO: Need some actual logic here for situation with no seed nodes (ie, maybe try again much later)
 
@@ -252,8 +474,24 @@ class Learner:
             self.remember_node(node)
 
     def sorted_nodes(self):
-        nodes_to_consider = list(self.known_nodes.values())
-        return sorted(nodes_to_consider, key=lambda n: n.checksum_public_address)
+        return self.known_nodes.sorted_nodes()
+
+    def _node_leaf_hash(self, node):
+        """
+        Hash node for the fleet state tree, reusing the cached hash
+        until the node's timestamp changes.
+        """
+        address = node.checksum_public_address
+        timestamp = node.timestamp
+        try:
+            cached_timestamp, leaf_hash = self._node_leaf_hashes[address]
+            if cached_timestamp == timestamp:
+                return leaf_hash
+        except KeyError:
+            pass
+        leaf_hash = keccak_digest(bytes(node))
+        self._node_leaf_hashes[address] = (timestamp, leaf_hash)
+        return leaf_hash
 
     def remember_node(self, node, force_verification_check=False, update_fleet_state=True):
 
@@ -264,13 +502,16 @@ class Learner:
         with suppress(KeyError):
             already_known_node = self.known_nodes[node.checksum_public_address]
             if not node.timestamp > already_known_node.timestamp:   
-                sendMessage(encodeMessage("log:Level:Debug, Date:{}, Message: Skipping already known node {}".format(get_sysdate(), already_known_node )))          
+                _log("Debug", "Skipping already known node {}", already_known_node)
                 #self.log.debug("Skipping already known node {}".format(already_known_node))
                 # This node is already known.  We can safely return.
                 return False
 
-        node.save_certificate_to_disk(directory=self.known_certificates_dir, force=True)  # TODO: Verify before force?
-        certificate_filepath = node.get_certificate_filepath(certificates_dir=self.known_certificates_dir)
+        if not self._certificate_already_saved(node):
+            # Verification below connects to the node using the certificate on disk, and once remembered
+            # the node's certificate is used straight away, so it has to be written now.
+            self._save_certificate(node)  # TODO: Verify before force?
+        certificate_filepath = self._certificate_filepath(node)
         try:
             node.verify_node(force=force_verification_check,
                              network_middleware=self.network_middleware,
@@ -279,33 +520,117 @@ class Learner:
         except SSLError:
             return False  # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?
         except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout):
-            sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Skipping already known node {}".format(get_sysdate(), already_known_node )))    
+            _log("Info", "No Response while trying to verify node {}|{}", node.rest_interface, node)
             #self.log.info("No Response while trying to verify node {}|{}".format(node.rest_interface, node))
             return False  # TODO: Bucket this node as "ghost" or something: somebody else knows about it, but we can't get to it.
 
-        listeners = self._learning_listeners.pop(node.checksum_public_address, tuple())
         address = node.checksum_public_address
+        with self._remembering:  # Nodes may be remembered from several verification threads at once.
+            # Another thread may have remembered a fresher copy while this one was being verified.
+            already_known_node = self.__known_nodes.get(address)
+            if already_known_node is not None and not node.timestamp > already_known_node.timestamp:
+                return False
 
-        self.__known_nodes[address] = node
+            listeners = self._learning_listeners.pop(address, tuple())
 
-        if self.save_metadata:
-            self.write_node_metadata(node=node)
+            if address not in self.__known_nodes:
+                self._teacher_permutation = None
+            self.__known_nodes[address] = node
+            self._known_node_timestamps[node.canonical_public_address] = node.timestamp.epoch
 
-        sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Remembering {}, popping {} listeners.".format(get_sysdate(), node.checksum_public_address, len(listeners) )))  
-        #self.log.info("Remembering {}, popping {} listeners.".format(node.checksum_public_address, len(listeners)))
-        for listener in listeners:
-            listener.add(address)
-        self._node_ids_to_learn_about_immediately.discard(address)
+            if self.save_metadata:
+                self.write_node_metadata(node=node)
+
+            _log("Info", "Remembering {}, popping {} listeners.", node.checksum_public_address, len(listeners))
+            #self.log.info("Remembering {}, popping {} listeners.".format(node.checksum_public_address, len(listeners)))
+            for listener in listeners:
+                listener.add(address)
+            self._wake_discovery_waiters()
+            self._node_ids_to_learn_about_immediately.discard(address)
 
         if update_fleet_state:
-            self.update_fleet_stfate()
+            self.update_fleet_state()
+
+        return True
+
+    def _knows_node_as_of(self, canonical_address: bytes, timestamp_epoch: int) -> bool:
+        """
+        Whether we already know the node at canonical_address from a copy at least as recent as timestamp_epoch.
+        """
+        known_timestamp_epoch = self._known_node_timestamps.get(canonical_address)
+        return known_timestamp_epoch is not None and timestamp_epoch <= known_timestamp_epoch
 
+    def _is_news(self, node) -> bool:
+        """
+        Whether node is unknown to us, or a newer copy of a node we know.
+        """
+        already_known_node = self.__known_nodes.get(node.checksum_public_address)
+        return already_known_node is None or node.timestamp > already_known_node.timestamp
+
+    def _save_certificate(self, node):
+        """
+        Write node's certificate to known_certificates_dir; it's recorded as saved only once the write succeeds.
+        """
+        node.save_certificate_to_disk(directory=self.known_certificates_dir, force=True)
+        self._saved_certificates[node.checksum_public_address] = node.certificate_fingerprint
+
+    def _certificate_already_saved(self, node) -> bool:
+        """
+        Whether this exact certificate was already written for node; if so, node is pointed at that file.
+        """
+        if self._saved_certificates.get(node.checksum_public_address) != node.certificate_fingerprint:
+            return False
+        if not node.rest_information()[0].host == node.common_name:
+            return False  # Let save_certificate_to_disk complain about it.
+        node.certificate_filepath = self._certificate_filepath(node)
         return True
 
+    def _certificate_filepath(self, node) -> str:
+        """
+        Path of node's certificate in known_certificates_dir, joined once per node.
+        """
+        address = node.checksum_public_address
+        try:
+            return self._certificate_filepaths[address]
+        except KeyError:
+            certificate_filepath = node.get_certificate_filepath(certificates_dir=self.known_certificates_dir)
+            self._certificate_filepaths[address] = certificate_filepath
+            return certificate_filepath
+
     def update_fleet_state(self):
         # TODO: Probably not mutate these foreign attrs - ideally maybe move quite a bit of this method up to FleetState (maybe in __setitem__).
-        self.known_nodes.checksum = keccak_digest(b"".join(bytes(n) for n in self.sorted_nodes())).hex()
-        self.known_nodes.updated = maya.now()
+        # The checksum is the root of a Merkle tree over the sorted nodes.  While membership holds still,
+        # only the leaves of refreshed nodes (and our own, which isn't in known_nodes) are re-hashed up the tree.
+        with self._fleet_tree_lock:
+            fleet = self.known_nodes
+            refreshed_nodes = []
+            while fleet.refreshed_addresses:
+                with suppress(KeyError):
+                    refreshed_nodes.append(fleet[fleet.refreshed_addresses.pop()])
+            if isinstance(self, VerifiableNode):  # sorted_nodes splices us in, for subclasses of Ursula too
+                refreshed_nodes.append(self)
+
+            if self._fleet_tree is None or self._fleet_tree_version != fleet.membership_version:
+                self._rebuild_fleet_tree()
+            else:
+                for node in refreshed_nodes:
+                    position = self._fleet_tree_positions.get(node.checksum_public_address)
+                    if position is None:
+                        self._rebuild_fleet_tree()
+                        break
+                    leaf_hash = self._node_leaf_hash(node)
+                    if leaf_hash != self._fleet_tree[0][position]:
+                        _update_merkle_leaf(self._fleet_tree, position, leaf_hash)
+
+            fleet_tree_root = self._fleet_tree[-1][0] if self._fleet_tree[0] else keccak_digest()
+            fleet.checksum = fleet_tree_root.hex()
+        fleet.updated = maya.now()
+
+    def _rebuild_fleet_tree(self):
+        nodes = self.sorted_nodes()
+        self._fleet_tree_version = self.known_nodes.membership_version
+        self._fleet_tree_positions = {node.checksum_public_address: position for position, node in enumerate(nodes)}
+        self._fleet_tree = _merkle_levels([self._node_leaf_hash(node) for node in nodes])
 
     def start_learning_loop(self, now=False):
         if self._learning_task.running:
@@ -328,15 +653,25 @@ class Learner:
         """
         Only for tests at this point.  Maybe some day for graceful shutdowns.
         """
+        if self._learning_task.running:
+            self._learning_task.stop()
+        self._wake_discovery_waiters()
+
+        # Let the worker threads go.  A fresh executor starts no threads until it's used, so the
+        # loop can still be restarted (or learned from on this thread) afterwards.
+        verification_pool = self._verification_pool
+        self._verification_pool = ThreadPoolExecutor(max_workers=self._VERIFICATION_WORKERS)
+        verification_pool.shutdown(wait=False)
 
     def handle_learning_errors(self, *args, **kwargs):
         failure = args[0]
+        self._wake_discovery_waiters()  # The learning loop stopped on this error
         if self._abort_on_learning_error:
-            sendMessage(encodeMessage("log:Level:Critical, Date:{}, Message: Unhandled error during node learning.  Attempting graceful crash.".format(get_sysdate())))   
+            _log("Critical", "Unhandled error during node learning.  Attempting graceful crash.")
             #self.log.critical("Unhandled error during node learning.  Attempting graceful crash.")
             reactor.callFromThread(self._crash_gracefully, failure=failure)
         else:
-            sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Unhandled error during node learning: {}".format(get_sysdate(), failure.getTraceback())))   
+            _log("Warn", "Unhandled error during node learning: {}", failure.getTraceback())
             #self.log.warn("Unhandled error during node learning: {}".format(failure.getTraceback()))
             if not self._learning_task.running:
                 self.start_learning_loop()  # TODO: Consider a single entry point for this with more elegant pause and unpause.
@@ -347,43 +682,45 @@ class Learner:
         is unhandled in a different thread, especially inside a loop like the learning loop.
         """
         self._crashed = failure
+        self._wake_discovery_waiters()
         failure.raiseException()
         # TODO: We don't actually have checksum_public_address at this level - maybe only Characters can crash gracefully :-)
-        sendMessage(encodeMessage("log:Level:Critical, Date:{}, Message: {} crashed with {}".format(get_sysdate(), self.checksum_public_address, failure)))  
+        _log("Critical", "{} crashed with {}", self.checksum_public_address, failure)
         #self.log.critical("{} crashed with {}".format(self.checksum_public_address, failure))
 
     def shuffled_known_nodes(self):
         nodes_we_know_about = list(self.__known_nodes.values())
         random.shuffle(nodes_we_know_about)
-        sendMessage(encodeMessage("knownnodes:Date:{}, Message:{}known nodes".format(get_sysdate(), len(nodes_we_know_about))))  
-        sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Shuffled {} known nodes".format(get_sysdate(), len(nodes_we_know_about))))  
+        _send_str("knownnodes:Date:{}, Message:{}known nodes".format(get_sysdate(), len(nodes_we_know_about)))
+        _log("Info", "Shuffled {} known nodes", len(nodes_we_know_about))
         #self.log.info("Shuffled {} known nodes".format(len(nodes_we_know_about)))
         return nodes_we_know_about
 
     def select_teacher_nodes(self):
-        nodes_we_know_about = self.shuffled_known_nodes()
+        # Only a batch of teachers is consumed before the fleet changes, so sample rather than shuffle everyone.
+        known_addresses = self.__known_nodes.sorted_addresses
+        _send_str("knownnodes:Date:{}, Message:{}known nodes".format(get_sysdate(), len(known_addresses)))
 
-        if not nodes_we_know_about:
+        if not known_addresses:
             raise self.NotEnoughTeachers("Need some nodes to start learning from.")
 
-        self.teacher_nodes.extend(nodes_we_know_about)
+        self._teacher_permutation = random.sample(known_addresses, min(len(known_addresses), self._TEACHER_BATCH_SIZE))
+        self._teacher_index = 0
 
     def cycle_teacher_node(self):
         # To ensure that all the best teachers are availalble, first let's make sure
         # that we have connected to all the seed nodes.
         if self.unresponsive_seed_nodes:
-            sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Still have unresponsive seed nodes; trying again to connect.".format(get_sysdate())))
+            _log("Info", "Still have unresponsive seed nodes; trying again to connect.")
             #self.log.info("Still have unresponsive seed nodes; trying again to connect.")
             self.load_seednodes()  # Ideally, this is async and singular.
 
-        if not self.teacher_nodes:
+        if not self._teacher_permutation or self._teacher_index >= len(self._teacher_permutation):
             self.select_teacher_nodes()
-        try:
-            self._current_teacher_node = self.teacher_nodes.pop()
-        except IndexError:
-            error = "Not enough nodes to select a good teacher, Check your network connection then node configuration"
-            raise self.NotEnoughTeachers(error)
-        sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Cycled teachers; New teacher is {}".format(get_sysdate(), self._current_teacher_node.checksum_public_address)))
+        teacher_address = self._teacher_permutation[self._teacher_index]
+        self._teacher_index += 1
+        self._current_teacher_node = self.__known_nodes[teacher_address]
+        _log("Info", "Cycled teachers; New teacher is {}", self._current_teacher_node.checksum_public_address)
         #self.log.info("Cycled teachers; New teacher is {}".format(self._current_teacher_node.checksum_public_address))
 
     def current_teacher_node(self, cycle=False):
@@ -402,11 +739,11 @@ class Learner:
             self._learning_task.reset()
             self._learning_task()
         elif not force:
-            sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Learning loop isn't started; can't learn about nodes now.  You can override this with force=True.".format(get_sysdate())))
+            _log("Warn", "Learning loop isn't started; can't learn about nodes now.  You can override this with force=True.")
             #self.log.warn(
             #    "Learning loop isn't started; can't learn about nodes now.  You can override this with force=True.")
         elif force:
-            sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Learning loop wasn't started; forcing start now.".format(get_sysdate())))
+            _log("Info", "Learning loop wasn't started; forcing start now.")
             #self.log.info("Learning loop wasn't started; forcing start now.")
             self._learning_task.start(self._SHORT_LEARNING_DELAY, now=True)
 
@@ -420,6 +757,24 @@ class Learner:
         self._node_ids_to_learn_about_immediately.update(canonical_addresses)  # hmmmm
         self.learn_about_nodes_now()
 
+    def _wake_discovery_waiters(self) -> None:
+        """
+        Make threads blocked in _wait_for_node_discovery re-check their conditions.
+        """
+        with self._node_discovery:
+            self._node_discovery_count += 1
+            self._node_discovery.notify_all()
+
+    def _wait_for_node_discovery(self, seen_discoveries: int, remaining: float, learn_on_this_thread: bool) -> None:
+        # Wake up as soon as another thread remembers a node instead of polling.  When the caller
+        # does its own learning nobody else may be discovering nodes, so only pause between rounds.
+        # The floor keeps us from spinning through the sub-second slack of the callers' timeout check.
+        interval = self._SAME_THREAD_LEARNING_INTERVAL
+        timeout = interval if learn_on_this_thread else max(remaining, interval)
+        with self._node_discovery:
+            self._node_discovery.wait_for(lambda: self._node_discovery_count != seen_discoveries,
+                                          timeout=timeout)
+
     # TODO: Dehydrate these next two methods.
 
     def block_until_number_of_known_nodes_is(self,
@@ -430,33 +785,37 @@ class Learner:
         starting_round = self._learning_round
 
         while True:
+            seen_discoveries = self._node_discovery_count
             rounds_undertaken = self._learning_round - starting_round
             if len(self.__known_nodes) >= number_of_nodes_to_know:
                 if rounds_undertaken:
-                   sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Learned about enough nodes after {} rounds.".format(get_sysdate(), rounds_undertaken)))
+                   _log("Info", "Learned about enough nodes after {} rounds.", rounds_undertaken)
                    # self.log.info("Learned about enough nodes after {} rounds.".format(rounds_undertaken))
                 return True
 
             if not self._learning_task.running:
-                sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Blocking to learn about nodes, but learning loop isn't running.".format(get_sysdate())))
+                _log("Warn", "Blocking to learn about nodes, but learning loop isn't running.")
                 #self.log.warn("Blocking to learn about nodes, but learning loop isn't running.")
             if learn_on_this_thread:
                 try:
                     self.learn_from_teacher_node(eager=True)
                 except (requests.exceptions.ReadTimeout, requests.exceptions.ConnectTimeout):
-                    sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Teacher was unreachable.  No good way to handle this on the main thread.".format(get_sysdate())))
+                    _log("Warn", "Teacher was unreachable.  No good way to handle this on the main thread.")
                     # TODO: Even this "same thread" logic can be done off the main thread.
                     #self.log.warn("Teacher was unreachable.  No good way to handle this on the main thread.")
 
             # The rest of the fucking owl
-            if (maya.now() - start).seconds > timeout:
+            elapsed = maya.now() - start
+            if elapsed.seconds > timeout:
                 if not self._learning_task.running:
                     raise self.NotEnoughTeachers("Learning loop is not running.  Start it with start_learning().")
                 else:
                     raise self.NotEnoughTeachers("After {} seconds and {} rounds, didn't find {} nodes".format(
                         timeout, rounds_undertaken, number_of_nodes_to_know))
             else:
-                time.sleep(.1)
+                self._wait_for_node_discovery(seen_discoveries,
+                                              remaining=timeout - elapsed.total_seconds(),
+                                              learn_on_this_thread=learn_on_this_thread)
 
     def block_until_specific_nodes_are_known(self,
                                              canonical_addresses: Set,
@@ -466,26 +825,31 @@ class Learner:
         start = maya.now()
         starting_round = self._learning_round
 
+        # Listen before the final membership check so that a node remembered in between isn't missed.
+        still_unknown = set(canonical_addresses).difference(self.__known_nodes)
+        self._push_certain_newly_discovered_nodes_here(_DiscoveryListener(still_unknown), tuple(still_unknown))
+        still_unknown.difference_update([address for address in tuple(still_unknown) if address in self.__known_nodes])
+
         while True:
             if self._crashed:
                 return self._crashed
+            seen_discoveries = self._node_discovery_count
             rounds_undertaken = self._learning_round - starting_round
-            if canonical_addresses.issubset(self.__known_nodes):
+            if not still_unknown:
                 if rounds_undertaken:
-                    sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Learned about all nodes after {} rounds.".format(get_sysdate(), rounds_undertaken)))
+                    _log("Info", "Learned about all nodes after {} rounds.", rounds_undertaken)
                     #self.log.info("Learned about all nodes after {} rounds.".format(rounds_undertaken))
                 return True
 
             if not self._learning_task.running:
-                sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Blocking to learn about nodes, but learning loop isn't running.".format(get_sysdate())))
+                _log("Warn", "Blocking to learn about nodes, but learning loop isn't running.")
                 #self.log.warn("Blocking to learn about nodes, but learning loop isn't running.")
             if learn_on_this_thread:
                 self.learn_from_teacher_node(eager=True)
 
-            if (maya.now() - start).seconds > timeout:
-
-                still_unknown = canonical_addresses.difference(self.__known_nodes)
-
+            elapsed = maya.now() - start
+            if elapsed.seconds > timeout:
+                still_unknown = set(still_unknown)  # Snapshot; listeners may still be discarding from it.
                 if len(still_unknown) <= allow_missing:
                     return False
                 elif not self._learning_task.running:
@@ -496,7 +860,9 @@ class Learner:
                             timeout, rounds_undertaken, len(still_unknown), still_unknown))
 
             else:
-                time.sleep(.1)
+                self._wait_for_node_discovery(seen_discoveries,
+                                              remaining=timeout - elapsed.total_seconds(),
+                                              learn_on_this_thread=learn_on_this_thread)
 
     def _adjust_learning(self, node_list):
         """
@@ -511,7 +877,7 @@ class Learner:
         else:
             self._rounds_without_new_nodes += 1
             if self._rounds_without_new_nodes > self._ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN:
-                sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: After {} rounds with no new nodes, it's time to slow down to {} seconds.".format(get_sysdate(), self._ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN, self._LONG_LEARNING_DELAY)))
+                _log("Info", "After {} rounds with no new nodes, it's time to slow down to {} seconds.", self._ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN, self._LONG_LEARNING_DELAY)
                 #self.log.info("After {} rounds with no new nodes, it's time to slow down to {} seconds.".format(
                 #    self._ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN,
                 #    self._LONG_LEARNING_DELAY))
@@ -522,7 +888,7 @@ class Learner:
         If any node_addresses are discovered, push them to queue_to_push.
         """
         for node_address in node_addresses:
-            sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Adding listener for {}".format(get_sysdate(), node_address)))
+            _log("Info", "Adding listener for {}", node_address)
             #self.log.info("Adding listener for {}".format(node_address))
             self._learning_listeners[node_address].append(queue_to_push)
 
@@ -555,7 +921,7 @@ class Learner:
         try:
             current_teacher = self.current_teacher_node()
         except self.NotEnoughTeachers as e:
-            sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Can't learn right now: {}".format(get_sysdate(), e.args[0])))
+            _log("Warn", "Can't learn right now: {}", e.args[0])
             #self.log.warn("Can't learn right now: {}".format(e.args[0]))
             return
 
@@ -563,27 +929,21 @@ class Learner:
 
         # TODO: Do we really want to try to learn about all these nodes instantly?
         # Hearing this traffic might give insight to an attacker.
-        if VerifiableNode in self.__class__.__bases__:
-            announce_nodes = [self]
-        else:
-            announce_nodes = None
+        announce_nodes = self._announce_nodes
 
         unresponsive_nodes = set()
+        teacher_certificate_filepath = self._certificate_filepath(current_teacher)
         try:
-
-            # TODO: Streamline path generation
-            certificate_filepath = current_teacher.get_certificate_filepath(
-                certificates_dir=self.known_certificates_dir)
             response = self.network_middleware.get_nodes_via_rest(url=rest_url,
                                                                   nodes_i_need=self._node_ids_to_learn_about_immediately,
                                                                   announce_nodes=announce_nodes,
-                                                                  certificate_filepath=certificate_filepath)
+                                                                  certificate_filepath=teacher_certificate_filepath)
         except requests.exceptions.ConnectionError as e:
             unresponsive_nodes.add(current_teacher)
             teacher_rest_info = current_teacher.rest_information()[0]
 
             # TODO: This error isn't necessarily "no repsonse" - let's maybe pass on the text of the exception here.
-            sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: No Response from teacher: {}:{}.".format(get_sysdate(), teacher_rest_info.host, teacher_rest_info.port )))
+            _log("Info", "No Response from teacher: {}:{}.", teacher_rest_info.host, teacher_rest_info.port)
             #self.log.info("No Response from teacher: {}:{}.".format(teacher_rest_info.host, teacher_rest_info.port))
             self.cycle_teacher_node()
             return
@@ -593,20 +953,30 @@ class Learner:
 
         signature, nodes = signature_splitter(response.content, return_remainder=True)
 
+        # Most of a teacher's nodes are ones we already know at least as recently; leave those as raw bytes
+        # rather than loading their keys and certificates.
+        known_copies = 0
+
+        def already_known(canonical_address, timestamp_epoch):
+            nonlocal known_copies
+            if self._knows_node_as_of(canonical_address, timestamp_epoch):
+                known_copies += 1
+                return True
+            return False
+
         # TODO: This doesn't make sense - a decentralized node can still learn about a federated-only node.
         from nucypher.characters.lawful import Ursula
-        node_list = Ursula.batch_from_bytes(nodes, federated_only=self.federated_only)  # TODO: 466
+        node_list = Ursula.batch_from_bytes(nodes,
+                                            federated_only=self.federated_only,  # TODO: 466
+                                            skip=already_known)
 
-        new_nodes = []
-        for node in node_list:
+        def verify_learned_node(node):
             try:
                 if eager:
-                    certificate_filepath = current_teacher.get_certificate_filepath(
-                        certificates_dir=self.known_certificates_dir)
                     node.verify_node(self.network_middleware,
                                      accept_federated_only=self.federated_only,  # TODO: 466
-                                     certificate_filepath=certificate_filepath)
-                    sendMessage(encodeMessage("log:Level:Debug, Date:{}, Message: Verified node: {}".format(get_sysdate(), node.checksum_public_address)))
+                                     certificate_filepath=teacher_certificate_filepath)
+                    _log("Debug", "Verified node: {}", node.checksum_public_address)
                     #self.log.debug("Verified node: {}".format(node.checksum_public_address))
 
                 else:
@@ -616,34 +986,107 @@ class Learner:
                 # TODO: Account for possibility that stamp, rather than interface, was bad.
                 message = "Suspicious Activity: Discovered node with bad signature: {}.  " \
                           "Propagated by: {}".format(current_teacher.checksum_public_address, rest_url)
-                sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: {}".format(get_sysdate(), message)))
+                _log("Warn", "{}", message)
                 #self.log.warn(message)
-            new = self.remember_node(node)
-            if new:
-                new_nodes.append(node)
+
+        # Copies of nodes we already know at least as recently would only be verified and then discarded
+        # by remember_node; verify just the news.
+        fresh_nodes = [node for node in node_list if self._is_news(node)]
+
+        def learn_node(node):
+            verify_learned_node(node)
+            return self.remember_node(node, update_fleet_state=False)
+
+        # Verifying and remembering a node are round-trips to that node; handle them side by side
+        # and settle the fleet state once for the whole batch.
+        learning = {self._verification_pool.submit(learn_node, node): node for node in fresh_nodes}
+        new_nodes = []
+        try:
+            for future in as_completed(learning):
+                try:
+                    if future.result():
+                        new_nodes.append(learning[future])
+                except Exception as e:
+                    # One bad node mustn't cost us the rest of the round.
+                    _log("Warn", "Failed to learn about node {}: {!r}", learning[future], e)
+        finally:
+            # Nodes remembered before any failure are already known; the checksum has to account for them
+            # and the next round should go to another teacher.
+            if new_nodes:
+                self.update_fleet_state()
+            current_teacher.last_seen = maya.now()
+            self.cycle_teacher_node()
 
         self._adjust_learning(new_nodes)
 
         learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
-        current_teacher.last_seen = maya.now()
-        self.cycle_teacher_node()
-        sendMessage(encodeMessage("log:Level:Info, Date:{}, Message: Learning round {}.  Teacher: {} knew about {} nodes, {} were new.".format(get_sysdate(), self._learning_round, current_teacher, len(node_list), len(new_nodes) )))
+        _log("Info", "Learning round {}.  Teacher: {} knew about {} nodes, {} were new.", self._learning_round, current_teacher, len(node_list) + known_copies, len(new_nodes))
         #self.log.info(learning_round_log_message.format(self._learning_round,
         #                                                current_teacher,
          #                                               len(node_list),
          #                                               len(new_nodes)), )
-        if new_nodes and self.known_certificates_dir:
-            for node in new_nodes:
-                node.save_certificate_to_disk(self.known_certificates_dir, force=True)
-
         return new_nodes
 
 
+# Teachers resend every node they know each round, and each copy arrives as a fresh object.
+# (signature, message, verifying key) triples that already verified don't need the curve math again.
+_VERIFIED_INTERFACE_SIGNATURES = set()
+_VERIFIED_INTERFACE_SIGNATURES_LIMIT = 8192
+
+def _certificate_fingerprint(certificate: Certificate) -> bytes:
+    return hashlib.sha256(certificate.public_bytes(Encoding.DER)).digest()
+
+
+# Nodes that recently passed verify_node's interface check, oldest first: key -> time of verification
+_RECENT_VERIFICATIONS = OrderedDict()
+_RECENT_VERIFICATIONS_LIMIT = 4096
+_RECENT_VERIFICATION_TTL = 60 * 60  # seconds
+_RECENT_VERIFICATIONS_LOCK = threading.Lock()
+
+
+def _recently_verified(key) -> bool:
+    with _RECENT_VERIFICATIONS_LOCK:
+        verified_at = _RECENT_VERIFICATIONS.get(key)
+        if verified_at is None:
+            return False
+        if time.monotonic() - verified_at > _RECENT_VERIFICATION_TTL:
+            del _RECENT_VERIFICATIONS[key]
+            return False
+        _RECENT_VERIFICATIONS.move_to_end(key)
+        return True
+
+
+def _remember_verification(key) -> None:
+    with _RECENT_VERIFICATIONS_LOCK:
+        _RECENT_VERIFICATIONS[key] = time.monotonic()
+        _RECENT_VERIFICATIONS.move_to_end(key)
+        if len(_RECENT_VERIFICATIONS) > _RECENT_VERIFICATIONS_LIMIT:
+            _RECENT_VERIFICATIONS.popitem(last=False)
+
+
+def _forget_verification(key) -> None:
+    with _RECENT_VERIFICATIONS_LOCK:
+        _RECENT_VERIFICATIONS.pop(key, None)
+
+
+def _record_verified_interface_signature(proof):
+    if len(_VERIFIED_INTERFACE_SIGNATURES) >= _VERIFIED_INTERFACE_SIGNATURES_LIMIT:
+        _VERIFIED_INTERFACE_SIGNATURES.clear()
+    _VERIFIED_INTERFACE_SIGNATURES.add(proof)
+
+
 class VerifiableNode:
     _evidence_of_decentralized_identity = constants.NOT_SIGNED
     verified_stamp = False
     verified_interface = False
     _verified_node = False
+    _common_name_cache = None  # (certificate, common name)
+    _cert_fp = None  # (certificate, SHA-256 fingerprint)
+    _nickname_icon = None
+    _signable_cached = None  # canonical address + interface info, until the interface is re-signed
+    _timestamp_bytes_cached = None  # (timestamp, its 4 signed bytes)
+    _public_key_bytes_cached = None  # (verifying key bytes, encrypting key bytes)
+    _sorted_nodes_with_self = None  # (fleet's sorted view, that view with this node spliced in)
     _interface_info_splitter = (int, 4, {'byteorder': 'big'})
     log = Logger("network/nodes")
 
@@ -659,6 +1102,7 @@ class VerifiableNode:
         self._interface_signature_object = interface_signature
         self._timestamp = timestamp
         self.last_seen = constants.NEVER_SEEN("Haven't connected to this node yet.")
+        self._precompute_signable()  # Characters set up their address and REST interface before this point.
 
     class InvalidNode(SuspiciousActivity):
         """
@@ -681,9 +1125,15 @@ class VerifiableNode:
         certificate = tls_hosting_power.keypair.certificate
         return cls(certificate=certificate, certificate_filepath=certificate_filepath, *args, **kwargs)
 
-    def sorted_nodes(self):
-        nodes_to_consider = list(self.known_nodes.values()) + [self]
-        return sorted(nodes_to_consider, key=lambda n: n.checksum_public_address)
+    def sorted_nodes(self) -> tuple:
+        # Splice ourselves into the fleet's cached view; redone only when that view changes.
+        fleet_nodes = self.known_nodes.sorted_nodes()
+        cached = self._sorted_nodes_with_self
+        if cached is None or cached[0] is not fleet_nodes:
+            position = bisect_left(self.known_nodes.sorted_addresses, self.checksum_public_address)
+            nodes_to_consider = fleet_nodes[:position] + (self,) + fleet_nodes[position:]
+            cached = self._sorted_nodes_with_self = (fleet_nodes, nodes_to_consider)
+        return cached[1]
 
     def _stamp_has_valid_wallet_signature(self):
         signature_bytes = self._evidence_of_decentralized_identity
@@ -711,13 +1161,26 @@ class VerifiableNode:
         else:
             raise self.InvalidNode
 
-    def interface_is_valid(self):
+    def _interface_proof(self) -> tuple:
         """
-        Checks that the interface info is valid for this node's canonical address.
+        The (signature, message, verifying key) bytes that interface_is_valid checks.
         """
         interface_info_message = self._signable_interface_info_message()  # Contains canonical address.
         message = self.timestamp_bytes() + interface_info_message
-        interface_is_valid = self._interface_signature.verify(message, self.public_keys(SigningPower))
+        return bytes(self._interface_signature), message, bytes(self.public_keys(SigningPower))
+
+    def interface_is_valid(self):
+        """
+        Checks that the interface info is valid for this node's canonical address.
+        """
+        proof = self._interface_proof()
+        if proof in _VERIFIED_INTERFACE_SIGNATURES:
+            interface_is_valid = True
+        else:
+            _signature_bytes, message, _verifying_key_bytes = proof
+            interface_is_valid = self._interface_signature.verify(message, self.public_keys(SigningPower))
+            if interface_is_valid:
+                _record_verified_interface_signature(proof)
         self.verified_interface = interface_is_valid
         if interface_is_valid:
             return True
@@ -758,33 +1221,63 @@ class VerifiableNode:
 
         self.validate_metadata(accept_federated_only)  # This is both the stamp and interface check.
 
+        # A fresh copy of a node we recently checked against the live interface needn't be checked again.
+        recent_verification_key = self._recent_verification_key()
+        if not force and _recently_verified(recent_verification_key):
+            self._verified_node = True
+            return True
+
         # The node's metadata is valid; let's be sure the interface is in order.
-        response = network_middleware.node_information(host=self.rest_information()[0].host,
-                                                       port=self.rest_information()[0].port,
+        rest_interface = self.rest_information()[0]
+        response = network_middleware.node_information(host=rest_interface.host,
+                                                       port=rest_interface.port,
                                                        certificate_filepath=certificate_filepath)
 
         if not response.status_code == 200:
             raise RuntimeError("Or something.")  # TODO: Raise an error here?  Or return False?  Or something?
-        timestamp, signature, identity_evidence, \
-        verifying_key, encrypting_key, \
-        public_address, certificate_vbytes, rest_info = self._internal_splitter(response.content)
+        timestamp, signature_bytes, identity_evidence, \
+        verifying_key_bytes, encrypting_key_bytes, \
+        public_address, _rest_of_node = self._node_information_splitter(response.content, return_remainder=True)
 
-        verifying_keys_match = verifying_key == self.public_keys(SigningPower)
-        encrypting_keys_match = encrypting_key == self.public_keys(EncryptingPower)
+        own_verifying_key_bytes, own_encrypting_key_bytes = self._public_key_bytes()
+        verifying_keys_match = verifying_key_bytes == own_verifying_key_bytes
+        encrypting_keys_match = encrypting_key_bytes == own_encrypting_key_bytes
         addresses_match = public_address == self.canonical_public_address
         evidence_matches = identity_evidence == self._evidence_of_decentralized_identity
 
         if not all((encrypting_keys_match, verifying_keys_match, addresses_match, evidence_matches)):
             # TODO: Optional reporting.  355
             if not addresses_match:
-               sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Wallet address swapped out.  It appears that someone is trying to defraud this node.".format(get_sysdate())))
+               _log("Warn", "Wallet address swapped out.  It appears that someone is trying to defraud this node.")
                # self.log.warn("Wallet address swapped out.  It appears that someone is trying to defraud this node.")
             if not verifying_keys_match:
-                sendMessage(encodeMessage("log:Level:Warn, Date:{}, Message: Verifying key swapped out.  It appears that someone is impersonating this node.".format(get_sysdate())))
+                _log("Warn", "Verifying key swapped out.  It appears that someone is impersonating this node.")
                 #self.log.warn("Verifying key swapped out.  It appears that someone is impersonating this node.")
+            _forget_verification(recent_verification_key)
             raise self.InvalidNode("Wrong cryptographic material for this node - something fishy going on.")
         else:
             self._verified_node = True
+            _remember_verification(recent_verification_key)
+
+    def _recent_verification_key(self) -> tuple:
+        """
+        Everything verify_node's interface check relies on: address and interface, TLS certificate,
+        keys and identity evidence.  An identical node seen recently would pass the same check.
+        """
+        evidence = self._evidence_of_decentralized_identity
+        return (self._signable_interface_info_message(),
+                self.certificate_fingerprint,
+                self._public_key_bytes(),
+                evidence if isinstance(evidence, bytes) else None)
+
+    def _public_key_bytes(self) -> tuple:
+        """
+        This node's verifying and encrypting keys as bytes, for comparing against what it serves.
+        """
+        if self._public_key_bytes_cached is None:
+            self._public_key_bytes_cached = (bytes(self.public_keys(SigningPower)),
+                                             bytes(self.public_keys(EncryptingPower)))
+        return self._public_key_bytes_cached
 
     def substantiate_stamp(self, passphrase: str):
         blockchain_power = self._crypto_power.power_ups(BlockchainPower)
@@ -792,11 +1285,22 @@ class VerifiableNode:
         signature = blockchain_power.sign_message(bytes(self.stamp))
         self._evidence_of_decentralized_identity = signature
 
+    def _precompute_signable(self):
+        self._signable_cached = bytes(self.canonical_public_address) + bytes(self.rest_information()[0])
+
+    def _invalidate_signable(self):
+        """
+        Forget the signable interface message, for when the node is rebound to a new interface.
+        """
+        self._signable_cached = None
+
     def _signable_interface_info_message(self):
-        message = self.canonical_public_address + self.rest_information()[0]
-        return message
+        if self._signable_cached is None:
+            self._precompute_signable()
+        return self._signable_cached
 
     def _sign_and_date_interface_info(self):
+        self._invalidate_signable()  # Re-signing is when the interface may have moved; build it afresh.
         message = self._signable_interface_info_message()
         self._timestamp = maya.now()
         self._interface_signature_object = self.stamp(self.timestamp_bytes() + message)
@@ -820,15 +1324,31 @@ class VerifiableNode:
         return self._timestamp
 
     def timestamp_bytes(self):
-        return self.timestamp.epoch.to_bytes(4, 'big')
+        timestamp = self.timestamp
+        cached = self._timestamp_bytes_cached
+        if cached is None or cached[0] is not timestamp:
+            cached = self._timestamp_bytes_cached = (timestamp, timestamp.epoch.to_bytes(4, 'big'))
+        return cached[1]
+
+    @property
+    def certificate_fingerprint(self) -> bytes:
+        # SHA-256 of the DER certificate, hashed once per certificate.
+        cached = self._cert_fp
+        if cached is None or cached[0] is not self.certificate:
+            cached = self._cert_fp = (self.certificate, _certificate_fingerprint(self.certificate))
+        return cached[1]
 
     @property
     def common_name(self):
-        x509 = OpenSSL.crypto.X509.from_cryptography(self.certificate)
-        subject_components = x509.get_subject().get_components()
-        common_name_as_bytes = subject_components[0][1]
-        common_name_from_cert = common_name_as_bytes.decode()
-        return common_name_from_cert
+        # Parsed once per certificate; a replaced certificate is parsed afresh.
+        cached = self._common_name_cache
+        if cached is None or cached[0] is not self.certificate:
+            x509 = OpenSSL.crypto.X509.from_cryptography(self.certificate)
+            subject_components = x509.get_subject().get_components()
+            common_name_as_bytes = subject_components[0][1]
+            common_name_from_cert = common_name_as_bytes.decode()
+            cached = self._common_name_cache = (self.certificate, common_name_from_cert)
+        return cached[1]
 
     @property
     def certificate_filename(self):
@@ -838,10 +1358,7 @@ class VerifiableNode:
         return os.path.join(certificates_dir, self.certificate_filename)
 
     def save_certificate_to_disk(self, directory, force=False):
-        x509 = OpenSSL.crypto.X509.from_cryptography(self.certificate)
-        subject_components = x509.get_subject().get_components()
-        common_name_as_bytes = subject_components[0][1]
-        common_name_from_cert = common_name_as_bytes.decode()
+        common_name_from_cert = self.common_name
 
         if not self.rest_information()[0].host == common_name_from_cert:
             # TODO: It's better for us to have checked this a while ago so that this situation is impossible.  #443
@@ -877,13 +1394,15 @@ class VerifiableNode:
                                  checksum_address=None,
                                  minimum_stake=0,
                                  network_middleware=None,
+                                 certificate=None,
                                  *args,
                                  **kwargs
                                  ):
         if network_middleware is None:
             network_middleware = RestMiddleware()
 
-        certificate = network_middleware.get_certificate(host=host, port=port)
+        if certificate is None:
+            certificate = network_middleware.get_certificate(host=host, port=port)
 
         real_host = certificate.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
         # Write certificate; this is really only for temporary purposes.  Ideally, we'd use
@@ -912,11 +1431,18 @@ class VerifiableNode:
             if minimum_stake > 0:
                 # TODO: check the blockchain to verify that address has more then minimum_stake. #511
                 raise NotImplementedError("Stake checking is not implemented yet.")
+        advertised_interface = potential_seed_node.rest_information()[0]
         try:
-            potential_seed_node.verify_node(
-                network_middleware=network_middleware,
-                accept_federated_only=federated_only,
-                certificate_filepath=certificate_filepath)
+            if (advertised_interface.host, advertised_interface.port) == (real_host, port):
+                # The node was just built from what this very interface serves, so asking it
+                # again could only return the same thing; checking its signatures is what's left.
+                potential_seed_node.validate_metadata(accept_federated_only=federated_only)
+                potential_seed_node._verified_node = True
+            else:
+                potential_seed_node.verify_node(
+                    network_middleware=network_middleware,
+                    accept_federated_only=federated_only,
+                    certificate_filepath=certificate_filepath)
         except potential_seed_node.InvalidNode:
             raise  # TODO: What if our seed node fails verification?
         return potential_seed_node
@@ -939,18 +1465,13 @@ class VerifiableNode:
         return stranger_ursula_from_public_keys
 
     def nickname_icon(self):
-        icon_template = """
-        <div class="nucypher-nickname-icon" style="border-top-color:{first_color}; border-left-color:{first_color}; border-bottom-color:{second_color}; border-right-color:{second_color};">
-        <span class="symbol" style="color: {first_color}">{first_symbol}</span>
-        <span class="symbol" style="color: {second_color}">{second_symbol}</span>
-        <br/>
-        <span class="small-address">{address_first6}</span>
-        </div>
-        """.replace("  ", "").replace('\n', "")
-        return icon_template.format(
-            first_color=self.nickname_metadata[0][0]['hex'],  # TODO: These index lookups are awful.
-            first_symbol=self.nickname_metadata[0][1],
-            second_color=self.nickname_metadata[1][0]['hex'],
-            second_symbol=self.nickname_metadata[1][1],
-            address_first6=self.checksum_public_address[2:8]
-        )
+        # A node's nickname and address don't change, so the icon is rendered once.
+        if self._nickname_icon is None:
+            self._nickname_icon = NICKNAME_ICON_TEMPLATE.format(
+                first_color=self.nickname_metadata[0][0]['hex'],  # TODO: These index lookups are awful.
+                first_symbol=self.nickname_metadata[0][1],
+                second_color=self.nickname_metadata[1][0]['hex'],
+                second_symbol=self.nickname_metadata[1][1],
+                address_first6=self.checksum_public_address[2:8]
+            )
+        return self._nickname_icon
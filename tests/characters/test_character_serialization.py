@@ -23,3 +23,15 @@ def test_serialize_ursula(federated_ursulas):
     ursula_as_bytes = bytes(ursula)
     ursula_object = Ursula.from_bytes(ursula_as_bytes, federated_only=True)
     assert ursula == ursula_object
+    assert bytes(ursula_object) == ursula_as_bytes
+
+
+def test_serialize_many_ursulas(federated_ursulas):
+    ursulas = sorted(federated_ursulas, key=lambda ursula: ursula.checksum_public_address)
+    ursulas_as_bytes = b''.join(bytes(ursula) for ursula in ursulas)
+    ursula_objects = Ursula.batch_from_bytes(ursulas_as_bytes, federated_only=True)
+    assert ursula_objects == ursulas
+
+    # Every field survives the trip, not just the stamp that equality compares.
+    for ursula, ursula_object in zip(ursulas, ursula_objects):
+        assert bytes(ursula_object) == bytes(ursula)
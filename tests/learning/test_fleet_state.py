@@ -1,8 +1,33 @@
+from nucypher.crypto.api import keccak_digest
+from nucypher.network.nodes import FleetState, _merkle_levels, _update_merkle_leaf
+
+
 def test_all_nodes_have_same_fleet_state(federated_ursulas):
     checksums = [u.known_nodes.checksum for u in federated_ursulas]
     assert len(set(checksums)) == 1  # There is only 1 unique value.
 
 
+def test_fleet_state_keeps_nodes_sorted_through_updates_and_deletes():
+    fleet = FleetState()
+    fleet["0xC"] = "node c"
+    fleet.update({"0xA": "node a", "0xB": "node b"})
+    assert fleet.sorted_addresses == ["0xA", "0xB", "0xC"]
+    assert fleet.sorted_nodes() == ("node a", "node b", "node c")
+    assert fleet.membership_version == 3
+    assert fleet.sorted_nodes() is fleet.sorted_nodes()  # Cached until the fleet changes
+
+    # Replacing a known node's entry refreshes the view without changing membership.
+    fleet["0xB"] = "newer node b"
+    assert fleet.sorted_nodes() == ("node a", "newer node b", "node c")
+    assert fleet.membership_version == 3
+    assert fleet.refreshed_addresses == {"0xB"}
+
+    del fleet["0xA"]
+    assert fleet.sorted_addresses == ["0xB", "0xC"]
+    assert fleet.sorted_nodes() == ("newer node b", "node c")
+    assert fleet.membership_version == 4
+
+
 def test_teacher_nodes_cycle(federated_ursulas):
     ursula = list(federated_ursulas)[0]
 
@@ -17,4 +42,33 @@ def test_teacher_nodes_cycle(federated_ursulas):
     ursula.learn_from_teacher_node()
     second_teacher = ursula._current_teacher_node
 
-    assert first_teacher != second_teacher
\ No newline at end of file
+    assert first_teacher != second_teacher
+
+def test_merkle_leaf_updates_match_a_rebuild():
+    for number_of_leaves in range(1, 10):
+        leaves = [keccak_digest(bytes([index])) for index in range(number_of_leaves)]
+        levels = _merkle_levels(list(leaves))
+
+        for position in range(number_of_leaves):
+            leaves[position] = keccak_digest(b"updated", bytes([position]))
+            _update_merkle_leaf(levels, position, leaves[position])
+
+            # Every level, not just the root, is what building from scratch would give.
+            assert levels == _merkle_levels(list(leaves))
+
+
+def test_incremental_fleet_state_matches_a_rebuild(federated_ursulas):
+    ursula, other_ursula = list(federated_ursulas)[:2]
+    ursula.update_fleet_state()
+
+    # Re-signing changes our own leaf, and handing over a re-signed copy of a known node changes its leaf;
+    # neither changes membership, so both are updated in place.
+    ursula._sign_and_date_interface_info()
+    other_ursula._sign_and_date_interface_info()
+    ursula.known_nodes[other_ursula.checksum_public_address] = other_ursula
+    ursula.update_fleet_state()
+    incremental_checksum = ursula.known_nodes.checksum
+
+    ursula._fleet_tree = None
+    ursula.update_fleet_state()
+    assert ursula.known_nodes.checksum == incremental_checksum
@@ -0,0 +1,91 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import pytest
+
+from nucypher.characters.lawful import Ursula, UrsulaBytesSplitter
+
+
+def test_teacher_batch_skips_only_nodes_known_as_recently(federated_ursulas, monkeypatch):
+    learner, unknown_ursula, outdated_ursula, current_ursula = list(federated_ursulas)[:4]
+
+    # The learner knows an older copy of one node and the very copy being sent of another.
+    monkeypatch.setattr(learner, '_known_node_timestamps', {
+        outdated_ursula.canonical_public_address: outdated_ursula.timestamp.epoch - 1,
+        current_ursula.canonical_public_address: current_ursula.timestamp.epoch,
+    })
+
+    batch = b''.join(bytes(ursula) for ursula in (unknown_ursula, outdated_ursula, current_ursula))
+    learned_ursulas = Ursula.batch_from_bytes(batch, federated_only=True, skip=learner._knows_node_as_of)
+    assert learned_ursulas == [unknown_ursula, outdated_ursula]
+
+    # Without a skip predicate, everything is deserialized.
+    assert Ursula.batch_from_bytes(batch, federated_only=True) == [unknown_ursula, outdated_ursula, current_ursula]
+
+
+def _comparable(fields):
+    # The splitters build equivalent objects, but not all of them compare by value; compare their bytes.
+    return [field if isinstance(field, int) else bytes(field) for field in fields]
+
+
+def test_compiled_splitter_matches_bytestring_splitter(federated_ursulas):
+    compiled_splitter = UrsulaBytesSplitter()
+    ursulas = list(federated_ursulas)
+    for ursula in ursulas:
+        ursula_as_bytes = bytes(ursula)
+        assert _comparable(compiled_splitter(ursula_as_bytes)) == \
+               _comparable(Ursula._bytestring_splitter(ursula_as_bytes))
+
+    batch = b''.join(bytes(ursula) for ursula in ursulas)
+    assert [_comparable(fields) for fields in compiled_splitter.repeat(batch)] == \
+           [_comparable(fields) for fields in Ursula._bytestring_splitter.repeat(batch)]
+
+
+def test_compiled_splitter_skips_before_building_fields(federated_ursulas):
+    compiled_splitter = UrsulaBytesSplitter()
+    first_ursula, second_ursula = list(federated_ursulas)[:2]
+    batch = bytes(first_ursula) + bytes(second_ursula)
+
+    offered = []
+
+    def skip_first(canonical_address, timestamp_epoch):
+        offered.append((canonical_address, timestamp_epoch))
+        return canonical_address == first_ursula.canonical_public_address
+
+    split_ursulas = compiled_splitter.repeat(batch, skip=skip_first)
+    assert [_comparable(fields) for fields in split_ursulas] == \
+           [_comparable(Ursula._bytestring_splitter(bytes(second_ursula)))]
+
+    # The predicate sees each node's raw address and timestamp, in order.
+    assert offered == [(first_ursula.canonical_public_address, first_ursula.timestamp.epoch),
+                       (second_ursula.canonical_public_address, second_ursula.timestamp.epoch)]
+
+
+def test_compiled_splitter_rejects_truncated_nodes(federated_ursulas):
+    compiled_splitter = UrsulaBytesSplitter()
+    first_ursula, second_ursula = list(federated_ursulas)[:2]
+    ursula_as_bytes = bytes(first_ursula)
+
+    for length in range(len(ursula_as_bytes)):
+        with pytest.raises(ValueError):
+            compiled_splitter(ursula_as_bytes[:length])
+
+    # A batch that breaks off partway through a node fails rather than dropping the tail.
+    with pytest.raises(ValueError):
+        compiled_splitter.repeat(bytes(second_ursula) + ursula_as_bytes[:-1])
+
+    with pytest.raises(ValueError):
+        compiled_splitter(ursula_as_bytes + b'\x00')